@@ -21,6 +21,10 @@ Install first:
 
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 from aumai_openjudge.core import CaseAnalyzer, LegalCodeDatabase
 from aumai_openjudge.models import LEGAL_DISCLAIMER, CaseAnalysis, LegalSection
 
@@ -29,129 +33,141 @@ from aumai_openjudge.models import LEGAL_DISCLAIMER, CaseAnalysis, LegalSection
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _print_section(section: LegalSection) -> None:
-    """Print a compact summary of a single LegalSection."""
-    bailable_label = (
-        "bailable" if section.bailable is True
-        else "non-bailable" if section.bailable is False
-        else "see statute"
+# Static format templates and labels, built once at import rather than per
+# print call.
+_BAILABLE_LABELS = {True: "bailable", False: "non-bailable", None: "see statute"}
+
+_SECTION_FMT = (
+    "    {code} {num}: {title}\n"
+    "      Punishment : {punishment}\n"
+    "      Bailable   : {bailable}"
+)
+
+
+def _format_section(section: LegalSection) -> str:
+    """Format a compact summary of a single LegalSection."""
+    return _SECTION_FMT.format(
+        code=section.code,
+        num=section.section_number,
+        title=section.title,
+        punishment=section.punishment or "See description",
+        bailable=_BAILABLE_LABELS[section.bailable],
     )
-    print(f"    {section.code} {section.section_number}: {section.title}")
-    print(f"      Punishment : {section.punishment or 'See description'}")
-    print(f"      Bailable   : {bailable_label}")
 
 
-def _print_analysis(analysis: CaseAnalysis) -> None:
-    """Print a structured summary of a CaseAnalysis result."""
-    print(f"\n  Summary:\n    {analysis.summary}")
+def _format_analysis(analysis: CaseAnalysis) -> str:
+    """Format a structured summary of a CaseAnalysis result as one block."""
+    buf = [f"\n  Summary:\n    {analysis.summary}"]
 
-    section_count = len(analysis.relevant_sections)
-    print(f"\n  Relevant sections ({section_count}) — showing up to 6:")
-    for section in analysis.relevant_sections[:6]:
-        _print_section(section)
+    sections = analysis.relevant_sections
+    buf.append(f"\n  Relevant sections ({len(sections)}) — showing up to 6:")
+    for section in islice(sections, 6):
+        buf.append(_format_section(section))
 
     if analysis.ipc_to_bns_mapping:
-        print("\n  IPC -> BNS transition mappings:")
+        buf.append("\n  IPC -> BNS transition mappings:")
         for mapping in analysis.ipc_to_bns_mapping:
-            print(
+            buf.append(
                 f"    {mapping['ipc']}  ->  {mapping['bns']}  "
                 f"[status: {mapping['status']}]"
             )
 
-    print(f"\n  Disclaimer: {analysis.disclaimer}")
+    buf.append(f"\n  Disclaimer: {analysis.disclaimer}")
+    return "\n".join(buf)
 
 
 # ---------------------------------------------------------------------------
 # Demo 1: Direct IPC section lookup
 # ---------------------------------------------------------------------------
 
-def demo_ipc_lookup() -> None:
+def demo_ipc_lookup(db: LegalCodeDatabase) -> str:
     """Look up IPC sections 302, 420, and 498A by their section numbers.
 
     LegalCodeDatabase.lookup_ipc() returns None when a section number is
     absent from the database — always handle None in production code.
     """
-    print("\n--- Demo 1: IPC Section Lookup ---")
-
-    db = LegalCodeDatabase()
+    buf = ["\n--- Demo 1: IPC Section Lookup ---"]
 
-    for section_number in ["302", "420", "498A"]:
-        section = db.lookup_ipc(section_number)
+    for section_number, section in db.lookup_ipc_many(["302", "420", "498A"]).items():
         if section is None:
-            print(f"  IPC {section_number}: not in database")
+            buf.append(f"  IPC {section_number}: not in database")
             continue
-        print(f"\n  IPC {section_number}:")
-        _print_section(section)
+        buf.append(f"\n  IPC {section_number}:")
+        buf.append(_format_section(section))
+
+    return "\n".join(buf)
 
 
 # ---------------------------------------------------------------------------
 # Demo 2: BNS 2023 section lookup
 # ---------------------------------------------------------------------------
 
-def demo_bns_lookup() -> None:
+def demo_bns_lookup(db: LegalCodeDatabase) -> str:
     """Look up BNS 2023 sections corresponding to the IPC sections in Demo 1.
 
     The Bharatiya Nyaya Sanhita (BNS) replaced the IPC from 1 July 2024.
     FIRs registered after that date are filed under BNS section numbers.
     """
-    print("\n--- Demo 2: BNS 2023 Section Lookup ---")
-
-    db = LegalCodeDatabase()
+    buf = ["\n--- Demo 2: BNS 2023 Section Lookup ---"]
 
     # BNS equivalents: IPC 302 -> BNS 103, IPC 420 -> BNS 318, IPC 498A -> BNS 85
-    for section_number in ["103", "318", "85"]:
-        section = db.lookup_bns(section_number)
+    for section_number, section in db.lookup_bns_many(["103", "318", "85"]).items():
         if section is None:
-            print(f"  BNS {section_number}: not in database")
+            buf.append(f"  BNS {section_number}: not in database")
             continue
-        print(f"\n  BNS {section_number}:")
-        _print_section(section)
+        buf.append(f"\n  BNS {section_number}:")
+        buf.append(_format_section(section))
+
+    return "\n".join(buf)
 
 
 # ---------------------------------------------------------------------------
 # Demo 3: Bulk IPC-to-BNS mapping
 # ---------------------------------------------------------------------------
 
-def demo_ipc_to_bns_mapping() -> None:
+def demo_ipc_to_bns_mapping(db: LegalCodeDatabase) -> str:
     """Map a set of IPC sections to their BNS equivalents in one pass.
 
     LegalCodeDatabase.map_ipc_to_bns() returns a LegalMapping with
     old_section, new_section, and status ('replaced', 'amended', 'repealed').
     Returns None when no mapping is recorded.
     """
-    print("\n--- Demo 3: Bulk IPC-to-BNS Mapping ---")
-
-    db = LegalCodeDatabase()
+    buf = ["\n--- Demo 3: Bulk IPC-to-BNS Mapping ---"]
 
     ipc_sections = ["302", "376", "304A", "420", "498A", "506"]
 
-    print(f"  {'IPC':>6}  ->  {'BNS':<6}  Status")
-    print(f"  {'-'*6}  --  {'-'*6}  {'-'*10}")
+    buf.append(f"  {'IPC':>6}  ->  {'BNS':<6}  Status")
+    buf.append(f"  {'-'*6}  --  {'-'*6}  {'-'*10}")
 
-    for ipc_number in ipc_sections:
-        mapping = db.map_ipc_to_bns(ipc_number)
+    # Pre-padded columns joined by constant separators: no format-spec
+    # machinery in the row loop.
+    for ipc_number, mapping in db.map_ipc_to_bns_many(ipc_sections).items():
         if mapping is None:
-            print(f"  {ipc_number:>6}       (no BNS mapping recorded)")
+            buf.append("  " + ipc_number.rjust(6) + "       (no BNS mapping recorded)")
         else:
-            print(
-                f"  {mapping.old_section:>6}  ->  {mapping.new_section:<6}  "
-                f"{mapping.status}"
+            buf.append(
+                "  "
+                + mapping.old_section.rjust(6)
+                + "  ->  "
+                + mapping.new_section.ljust(6)
+                + "  "
+                + mapping.status
             )
 
+    return "\n".join(buf)
+
 
 # ---------------------------------------------------------------------------
 # Demo 4: Single-offence case analysis
 # ---------------------------------------------------------------------------
 
-def demo_single_offence_analysis() -> None:
+def demo_single_offence_analysis(analyzer: CaseAnalyzer) -> str:
     """Analyse a robbery case description using keyword-based section matching.
 
     CaseAnalyzer.analyze() returns both legacy IPC and current BNS 2023
     sections, plus a plain-English summary and the mandatory disclaimer.
     """
-    print("\n--- Demo 4: Single-Offence Case Analysis (Robbery) ---")
-
-    analyzer = CaseAnalyzer()
+    buf = ["\n--- Demo 4: Single-Offence Case Analysis (Robbery) ---"]
 
     case_description = (
         "On the night of 15 February 2026, the accused allegedly snatched "
@@ -160,25 +176,26 @@ def demo_single_offence_analysis() -> None:
         "Three witnesses have provided statements to the police."
     )
 
-    print(f"  Case: {case_description[:110]}...")
+    head = case_description[:110]
+    buf.append(f"  Case: {head}...")
     analysis = analyzer.analyze(case_description)
-    _print_analysis(analysis)
+    buf.append(_format_analysis(analysis))
+
+    return "\n".join(buf)
 
 
 # ---------------------------------------------------------------------------
 # Demo 5: Multi-offence case analysis
 # ---------------------------------------------------------------------------
 
-def demo_multi_offence_analysis() -> None:
+def demo_multi_offence_analysis(analyzer: CaseAnalyzer) -> str:
     """Analyse a complex case spanning multiple overlapping offence categories.
 
     When the description contains keywords for several offences, the analyzer
     surfaces all matching IPC and BNS sections so that counsel can review
     which charges to frame.
     """
-    print("\n--- Demo 5: Multi-Offence Case Analysis ---")
-
-    analyzer = CaseAnalyzer()
+    buf = ["\n--- Demo 5: Multi-Offence Case Analysis ---"]
 
     case_description = (
         "The complainant alleges that her husband and his relatives subjected "
@@ -189,9 +206,12 @@ def demo_multi_offence_analysis() -> None:
         "registered at the local police station."
     )
 
-    print(f"  Case: {case_description[:110]}...")
+    head = case_description[:110]
+    buf.append(f"  Case: {head}...")
     analysis = analyzer.analyze(case_description)
-    _print_analysis(analysis)
+    buf.append(_format_analysis(analysis))
+
+    return "\n".join(buf)
 
 
 # ---------------------------------------------------------------------------
@@ -206,11 +226,24 @@ def main() -> None:
     print("=" * 60)
     print(f"\nDISCLAIMER: {LEGAL_DISCLAIMER}\n")
 
-    demo_ipc_lookup()
-    demo_bns_lookup()
-    demo_ipc_to_bns_mapping()
-    demo_single_offence_analysis()
-    demo_multi_offence_analysis()
+    # Build the database and analyzer once; every demo is read-only, so
+    # sharing a single instance avoids rebuilding the statute tables.
+    db = LegalCodeDatabase()
+    analyzer = CaseAnalyzer()
+
+    # The demos are independent and each returns its output as one block,
+    # so they can run concurrently; results are written in demo order to
+    # keep the transcript deterministic.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(demo_ipc_lookup, db),
+            executor.submit(demo_bns_lookup, db),
+            executor.submit(demo_ipc_to_bns_mapping, db),
+            executor.submit(demo_single_offence_analysis, analyzer),
+            executor.submit(demo_multi_offence_analysis, analyzer),
+        ]
+        for future in futures:
+            sys.stdout.write(future.result() + "\n")
 
     print("\nDone.")
 
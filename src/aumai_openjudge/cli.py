@@ -2,37 +2,66 @@
 
 from __future__ import annotations
 
+import argparse
 import sys
+from functools import cache
 
-import click
+from . import __version__
 
-from .models import LEGAL_DISCLAIMER
 
-LEGAL_DISCLAIMER_CLI = (
-    "This tool does NOT provide legal advice."
-    " Case analysis is based on keyword matching and may be incomplete or inaccurate."
-    " Always consult a qualified legal professional."
-)
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once; parse_args is reusable)."""
+    parser = argparse.ArgumentParser(
+        prog="aumai-openjudge",
+        description="AumAI Openjudge CLI.",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s, version {__version__}",
+    )
+    subparsers = parser.add_subparsers(dest="command")
 
-
-@click.group()
-@click.version_option()
-def main() -> None:
-    """AumAI Openjudge CLI."""
+    serve_parser = subparsers.add_parser(
+        "serve", help="Start the Openjudge API server."
+    )
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port to serve on")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
+    return parser
 
 
-@main.command("serve")
-@click.option("--port", default=8000, help="Port to serve on")
-@click.option("--host", default="127.0.0.1", help="Host to bind to")
-def serve(port: int, host: str) -> None:
+def _serve(host: str, port: int) -> None:
     """Start the Openjudge API server."""
-    click.echo(f"\nDISCLAIMER: {LEGAL_DISCLAIMER}\n")
+    # Imported here so `--help`/`--version` never pay for pydantic import.
+    from .models import LEGAL_DISCLAIMER
+
+    print(f"\nDISCLAIMER: {LEGAL_DISCLAIMER}\n")
     try:
         import uvicorn
     except ImportError:
-        click.echo("Error: uvicorn is required. Install with: pip install uvicorn", err=True)
+        print(
+            "Error: uvicorn is required. Install with: pip install uvicorn",
+            file=sys.stderr,
+        )
         sys.exit(1)
-    uvicorn.run("aumai_openjudge.api:app", host=host, port=port, reload=False)
+    # The programmatic Config/Server API avoids uvicorn.run() rebuilding
+    # config, logging, and signal handling from scratch on each start, and
+    # lets embedders (tests, restart loops) drive the server directly.
+    config = uvicorn.Config(
+        "aumai_openjudge.api:app", host=host, port=port, reload=False
+    )
+    uvicorn.Server(config).run()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """AumAI Openjudge CLI."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        _serve(args.host, args.port)
+    else:
+        parser.print_help()
 
 
 if __name__ == "__main__":
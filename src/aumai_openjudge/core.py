@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from functools import cache
+from typing import NamedTuple, cast
+
+from pydantic import TypeAdapter
+
 from .models import LEGAL_DISCLAIMER, CaseAnalysis, LegalMapping, LegalSection
 
 __all__ = ["LegalCodeDatabase", "CaseAnalyzer"]
@@ -138,116 +146,390 @@ _KEYWORD_SECTION_MAP: list[tuple[list[str], list[str], str]] = [
     (["eve teasing", "gesture insult woman", "verbal harassment woman"], ["IPC-509", "BNS-79"], "insulting woman's modesty"),
 ]
 
+class _KeywordRow(NamedTuple):
+    """One frozen row of the keyword table, precomputed at import.
+
+    ipc_numbers holds the bare numbers of the row's IPC section ids, so the
+    analysis loop never splits or prefix-checks id strings per call.
+    """
+
+    keywords: tuple[str, ...]
+    section_ids: tuple[str, ...]
+    category: str
+    ipc_numbers: tuple[str, ...]
+
+
+_ROWS: tuple[_KeywordRow, ...] = tuple(
+    _KeywordRow(
+        keywords=tuple(keywords),
+        section_ids=tuple(section_ids),
+        category=category,
+        ipc_numbers=tuple(
+            sec_id[4:] for sec_id in section_ids if sec_id.startswith("IPC-")
+        ),
+    )
+    for keywords, section_ids, category in _KEYWORD_SECTION_MAP
+)
+
+# Structure-of-arrays views over _ROWS for the analysis loop: the matched row
+# index goes straight into flat parallel tuples, with no per-iteration named
+# tuple unpacking.
+_ROW_SECTION_IDS: tuple[tuple[str, ...], ...] = tuple(r.section_ids for r in _ROWS)
+_ROW_CATEGORIES: tuple[str, ...] = tuple(r.category for r in _ROWS)
+
+# One bit per distinct section id: "seen" tracking in the analysis loop is an
+# integer mask instead of a set of strings.
+_SEC_ID_BIT: dict[str, int] = {
+    sec_id: 1 << i
+    for i, sec_id in enumerate(
+        sorted({sec_id for row in _ROWS for sec_id in row.section_ids})
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Precompiled single-pass keyword matcher
+# ---------------------------------------------------------------------------
+# The keyword table is static, so matching is specialized at import time.
+# When the optional pyahocorasick package is installed its C automaton scans
+# the description in a single linear pass. Otherwise a straight-line matcher
+# function is generated from the table (one `if kw in d or ...` branch per
+# row) and compiled once with exec — measurably faster than both a regex
+# alternation and interpreting the tuple table per call, with identical
+# semantics to per-keyword `in` checks.
+
+try:  # pragma: no cover - optional accelerator
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:
+    ahocorasick = None
+
+
+def _keyword_row_sets() -> dict[str, frozenset[int]]:
+    keyword_rows: dict[str, set[int]] = {}
+    for row_idx, row in enumerate(_ROWS):
+        for keyword in row.keywords:
+            keyword_rows.setdefault(keyword, set()).add(row_idx)
+    return {kw: frozenset(rows) for kw, rows in keyword_rows.items()}
+
+
+_KEYWORD_ROW_SETS = _keyword_row_sets()
+
+
+def _compile_fallback_matcher() -> Callable[[str], list[int]]:
+    """Generate a straight-line row matcher specialized to the keyword table."""
+    lines = ["def _match(d):", "    hits = []"]
+    for row_idx, row in enumerate(_ROWS):
+        condition = " or ".join(f"{keyword!r} in d" for keyword in row.keywords)
+        lines.append(f"    if {condition}:")
+        lines.append(f"        hits.append({row_idx})")
+    lines.append("    return hits")
+    namespace: dict[str, object] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102 - source built from static literals
+    return cast(Callable[[str], list[int]], namespace["_match"])
+
+
+_FALLBACK_MATCH = _compile_fallback_matcher()
+
+
+def _build_keyword_automaton() -> object | None:
+    """Compile the keyword table into an Aho-Corasick automaton, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, rows in _KEYWORD_ROW_SETS.items():
+        automaton.add_word(keyword, rows)
+    automaton.make_automaton()
+    return cast(object, automaton)
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _match_rows(desc_lower: str) -> list[int]:
+    """Return indices of _ROWS entries matched by the description."""
+    if _KEYWORD_AUTOMATON is not None:
+        # Automaton.iter reports every keyword occurrence, including those
+        # nested inside longer keywords.
+        matched: set[int] = set()
+        for _, rows in _KEYWORD_AUTOMATON.iter(desc_lower):  # type: ignore[attr-defined]
+            matched.update(rows)
+        return sorted(matched)
+    return _FALLBACK_MATCH(desc_lower)
+
+
+def _intern_section_row(row: dict[str, object]) -> dict[str, object]:
+    """Return a section row with its hot string fields interned.
+
+    Codes ("IPC"/"BNS") and section numbers are compared and dict-keyed
+    constantly; interning makes those checks pointer comparisons.
+    """
+    interned = dict(row)
+    interned["code"] = sys.intern(str(row["code"]))
+    interned["section_number"] = sys.intern(str(row["section_number"]))
+    return interned
+
+
+def _intern_mapping_row(row: dict[str, object]) -> dict[str, object]:
+    """Return a mapping row with its hot string fields interned."""
+    interned = dict(row)
+    for field in ("old_code", "old_section", "new_code", "new_section", "status"):
+        interned[field] = sys.intern(str(row[field]))
+    return interned
+
+
+# The model instances are validated exactly once here, at import. The data is
+# static and the models are treated as immutable, so every LegalCodeDatabase
+# shares these rather than re-running pydantic validation per instance.
+_IPC_SECTION_MODELS: tuple[LegalSection, ...] = tuple(
+    LegalSection(**_intern_section_row(s))  # type: ignore[arg-type]
+    for s in _IPC_SECTIONS
+)
+_BNS_SECTION_MODELS: tuple[LegalSection, ...] = tuple(
+    LegalSection(**_intern_section_row(s))  # type: ignore[arg-type]
+    for s in _BNS_SECTIONS
+)
+_MAPPING_MODELS: tuple[LegalMapping, ...] = tuple(
+    LegalMapping(**_intern_mapping_row(m))  # type: ignore[arg-type]
+    for m in _IPC_TO_BNS_MAPPINGS
+)
+
+# Direct section-id index ("IPC-302" -> section) for the analysis hot loop:
+# one dict probe instead of split + code branch + per-database lookup.
+_SECTION_BY_ID: dict[str, LegalSection] = {
+    f"{s.code}-{s.section_number}": s
+    for s in (*_IPC_SECTION_MODELS, *_BNS_SECTION_MODELS)
+}
+
+_MAPPING_BY_IPC: dict[str, LegalMapping] = {m.old_section: m for m in _MAPPING_MODELS}
+
+# Per-row IPC->BNS mappings, resolved once at import: the analysis loop reads
+# the finished mapping objects instead of re-querying the index per match.
+_ROW_MAPPINGS: tuple[tuple[LegalMapping, ...], ...] = tuple(
+    tuple(_MAPPING_BY_IPC[num] for num in row.ipc_numbers if num in _MAPPING_BY_IPC)
+    for row in _ROWS
+)
+
 
 class LegalCodeDatabase:
     """Database of IPC, BNS, CrPC, and BNSS sections with cross-reference lookup."""
 
+    __slots__ = (
+        "_sections",
+        "_mappings",
+        "_ipc_to_bns_index",
+        "_last_ipc",
+        "_all_ipc",
+        "_all_bns",
+    )
+
     def __init__(self) -> None:
-        self._ipc: dict[str, LegalSection] = {
-            s["section_number"]: LegalSection(**s)  # type: ignore[arg-type]
-            for s in _IPC_SECTIONS
-        }
-        self._bns: dict[str, LegalSection] = {
-            s["section_number"]: LegalSection(**s)  # type: ignore[arg-type]
-            for s in _BNS_SECTIONS
-        }
-        self._mappings: list[LegalMapping] = [
-            LegalMapping(**m) for m in _IPC_TO_BNS_MAPPINGS  # type: ignore[arg-type]
-        ]
-        # Build reverse index: IPC section -> mapping
-        self._ipc_to_bns_index: dict[str, LegalMapping] = {
-            m.old_section: m for m in self._mappings
-        }
+        # One dict keyed "CODE-number" for both statutes: every lookup is a
+        # single .get with no IPC/BNS branch.
+        self._sections: dict[str, LegalSection] = _SECTION_BY_ID
+        self._mappings: list[LegalMapping] = list(_MAPPING_MODELS)
+        # Reverse index (IPC section -> mapping), shared with the module.
+        self._ipc_to_bns_index: dict[str, LegalMapping] = _MAPPING_BY_IPC
+        # Immutable snapshots shared by every all_ipc()/all_bns() call.
+        self._all_ipc: tuple[LegalSection, ...] = _IPC_SECTION_MODELS
+        self._all_bns: tuple[LegalSection, ...] = _BNS_SECTION_MODELS
+        # Single-entry memo for the hottest lookup: (raw query, result).
+        self._last_ipc: tuple[str, LegalSection | None] | None = None
 
     def lookup_ipc(self, section: str) -> LegalSection | None:
         """Look up an IPC section by number."""
-        return self._ipc.get(section.strip())
+        last = self._last_ipc
+        if last is not None and last[0] == section:
+            return last[1]
+        result = self._sections.get("IPC-" + section.strip().upper())
+        self._last_ipc = (section, result)
+        return result
 
     def lookup_bns(self, section: str) -> LegalSection | None:
         """Look up a BNS section by number."""
-        return self._bns.get(section.strip())
+        return self._sections.get("BNS-" + section.strip().upper())
 
     def map_ipc_to_bns(self, ipc_section: str) -> LegalMapping | None:
         """Get the BNS equivalent for an IPC section."""
-        return self._ipc_to_bns_index.get(ipc_section.strip())
+        return self._ipc_to_bns_index.get(ipc_section.strip().upper())
+
+    def lookup_ipc_many(
+        self, sections: Iterable[str]
+    ) -> dict[str, LegalSection | None]:
+        """Look up several IPC sections in one pass.
+
+        Returns a dict keyed by the requested section numbers; missing
+        sections map to None.
+        """
+        return {s: self._sections.get("IPC-" + s.strip().upper()) for s in sections}
+
+    def lookup_bns_many(
+        self, sections: Iterable[str]
+    ) -> dict[str, LegalSection | None]:
+        """Look up several BNS sections in one pass."""
+        return {s: self._sections.get("BNS-" + s.strip().upper()) for s in sections}
+
+    def map_ipc_to_bns_many(
+        self, ipc_sections: Iterable[str]
+    ) -> dict[str, LegalMapping | None]:
+        """Get the BNS equivalents for several IPC sections in one pass."""
+        return {s: self._ipc_to_bns_index.get(s.strip().upper()) for s in ipc_sections}
+
+    def all_ipc(self) -> tuple[LegalSection, ...]:
+        """Return all IPC sections as a shared immutable tuple."""
+        return self._all_ipc
+
+    def all_bns(self) -> tuple[LegalSection, ...]:
+        """Return all BNS sections as a shared immutable tuple."""
+        return self._all_bns
+
 
-    def all_ipc(self) -> list[LegalSection]:
-        """Return all IPC sections."""
-        return list(self._ipc.values())
+# Static summary fragments, interned once at import instead of being
+# reassembled inside every analyze call.
+_NO_MATCH_SUMMARY = (
+    "No specific IPC/BNS sections could be matched to the case description."
+    " The case may involve civil law, special statutes, or requires more detail."
+    " Consult a qualified advocate for proper legal analysis."
+)
+_SUMMARY_TAIL = (
+    "Note: The Bharatiya Nyaya Sanhita (BNS) 2023 replaced the IPC from 1 July 2024."
+    " New cases are charged under BNS; old cases under IPC."
+)
 
-    def all_bns(self) -> list[LegalSection]:
-        """Return all BNS sections."""
-        return list(self._bns.values())
+
+# Bulk serialiser for analysis batches: one pydantic-core dump_json call
+# encodes the whole list, instead of joining per-instance model_dump_json.
+_ANALYSIS_LIST_ADAPTER: TypeAdapter[list[CaseAnalysis]] = TypeAdapter(
+    list[CaseAnalysis]
+)
+
+
+@cache
+def _get_db() -> LegalCodeDatabase:
+    """Return the shared LegalCodeDatabase instance.
+
+    The statute data is immutable, so one database serves every analyzer
+    (and any per-request construction in a server) without rebuild cost.
+    """
+    return LegalCodeDatabase()
 
 
 class CaseAnalyzer:
     """Analyses case descriptions against Indian law through keyword matching."""
 
+    # Maximum number of cached analyses kept per analyzer instance.
+    _CACHE_SIZE = 256
+
     def __init__(self) -> None:
-        self._db = LegalCodeDatabase()
+        self._db = _get_db()
+        # LRU cache of prior analyses keyed by the description itself, so
+        # re-analysing identical text is a dict hit. str keys avoid an
+        # encode step that would choke on surrogates, and each CaseAnalysis
+        # already holds the description, so the keys add no new memory.
+        self._cache: OrderedDict[str, CaseAnalysis] = OrderedDict()
 
     def analyze(self, case_description: str) -> CaseAnalysis:
         """Perform keyword-based legal analysis on a case description."""
+        cache_key = case_description
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            try:
+                self._cache.move_to_end(cache_key)
+            except KeyError:
+                # Another thread's eviction won the race; the result is
+                # still valid, only its recency bump is lost.
+                pass
+            return cached
+
+        analysis = self._analyze_uncached(case_description)
+        self._cache[cache_key] = analysis
+        if len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return analysis
+
+    def analyze_batch(self, case_descriptions: Iterable[str]) -> list[CaseAnalysis]:
+        """Analyse several case descriptions in one call.
+
+        Bulk ingestion repeats descriptions surprisingly often (template
+        FIRs, resubmissions); identical texts within a batch are analysed
+        once and share one CaseAnalysis via the result cache. Results come
+        back in input order.
+        """
+        unique: dict[str, CaseAnalysis] = {}
+        descriptions = list(case_descriptions)
+        for description in descriptions:
+            if description not in unique:
+                unique[description] = self.analyze(description)
+        return [unique[description] for description in descriptions]
+
+    def analyze_batch_json(self, case_descriptions: Iterable[str]) -> bytes:
+        """Analyse several case descriptions and serialise the results to JSON.
+
+        The whole batch is encoded as one JSON array in a single
+        pydantic-core call, instead of a per-result model_dump_json loop.
+        Intended for batch endpoints that stream the bytes straight into a
+        response body.
+        """
+        return _ANALYSIS_LIST_ADAPTER.dump_json(self.analyze_batch(case_descriptions))
+
+    def _analyze_uncached(self, case_description: str) -> CaseAnalysis:
         desc_lower = case_description.lower()
-        relevant_sections: list[LegalSection] = []
+        # Insertion-ordered dict keyed by (code, number): O(1) dedup across
+        # keyword categories that surface the same section.
+        seen_sections: dict[tuple[str, str], LegalSection] = {}
         ipc_to_bns_mappings: list[dict[str, object]] = []
         matched_categories: list[str] = []
-        seen_section_ids: set[str] = set()
-
-        for keywords, section_ids, category in _KEYWORD_SECTION_MAP:
-            if any(kw in desc_lower for kw in keywords):
-                for sec_id in section_ids:
-                    if sec_id in seen_section_ids:
-                        continue
-                    seen_section_ids.add(sec_id)
-                    code, number = sec_id.split("-", 1)
-                    if code == "IPC":
-                        section = self._db.lookup_ipc(number)
-                    elif code == "BNS":
-                        section = self._db.lookup_bns(number)
-                    else:
-                        section = None
-
-                    if section:
-                        relevant_sections.append(section)
-
-                if category not in matched_categories:
-                    matched_categories.append(category)
-
-                # Add IPC->BNS mapping for matched IPC sections
-                for sec_id in section_ids:
-                    if sec_id.startswith("IPC-"):
-                        ipc_num = sec_id[4:]
-                        mapping = self._db.map_ipc_to_bns(ipc_num)
-                        if mapping:
-                            mapping_dict: dict[str, object] = {
-                                "ipc": f"IPC {mapping.old_section}",
-                                "bns": f"BNS {mapping.new_section}",
-                                "status": mapping.status,
-                            }
-                            if mapping_dict not in ipc_to_bns_mappings:
-                                ipc_to_bns_mappings.append(mapping_dict)
+        matched_category_set: set[str] = set()
+        seen_section_mask = 0
+        seen_mapping_keys: set[tuple[str, str]] = set()
+
+        for row_idx in _match_rows(desc_lower):
+            for sec_id in _ROW_SECTION_IDS[row_idx]:
+                bit = _SEC_ID_BIT[sec_id]
+                if seen_section_mask & bit:
+                    continue
+                seen_section_mask |= bit
+                section = _SECTION_BY_ID.get(sec_id)
+                if section:
+                    seen_sections.setdefault(
+                        (section.code, section.section_number), section
+                    )
+
+            category = _ROW_CATEGORIES[row_idx]
+            if category not in matched_category_set:
+                matched_category_set.add(category)
+                matched_categories.append(category)
+
+            # Add IPC->BNS mapping for matched IPC sections (resolved at import)
+            for mapping in _ROW_MAPPINGS[row_idx]:
+                mapping_key = (mapping.old_section, mapping.new_section)
+                if mapping_key not in seen_mapping_keys:
+                    seen_mapping_keys.add(mapping_key)
+                    ipc_to_bns_mappings.append(
+                        {
+                            "ipc": f"IPC {mapping.old_section}",
+                            "bns": f"BNS {mapping.new_section}",
+                            "status": mapping.status,
+                        }
+                    )
+
+        relevant_sections = list(seen_sections.values())
 
         if not relevant_sections:
-            summary = (
-                "No specific IPC/BNS sections could be matched to the case description."
-                " The case may involve civil law, special statutes, or requires more detail."
-                " Consult a qualified advocate for proper legal analysis."
-            )
+            summary = _NO_MATCH_SUMMARY
         else:
             ipc_refs = [s.section_number for s in relevant_sections if s.code == "IPC"]
             bns_refs = [s.section_number for s in relevant_sections if s.code == "BNS"]
-            summary = (
+            parts = [
                 f"The case potentially involves the following offences: {', '.join(matched_categories)}. "
-            )
+            ]
             if ipc_refs:
-                summary += f"Relevant IPC sections: {', '.join(ipc_refs)}. "
+                parts.append(f"Relevant IPC sections: {', '.join(ipc_refs)}. ")
             if bns_refs:
-                summary += f"Corresponding BNS 2023 sections: {', '.join(bns_refs)}. "
-            summary += (
-                "Note: The Bharatiya Nyaya Sanhita (BNS) 2023 replaced the IPC from 1 July 2024."
-                " New cases are charged under BNS; old cases under IPC."
-            )
+                parts.append(
+                    f"Corresponding BNS 2023 sections: {', '.join(bns_refs)}. "
+                )
+            parts.append(_SUMMARY_TAIL)
+            summary = "".join(parts)
 
         return CaseAnalysis(
             case_description=case_description,
@@ -1 +1,31 @@
 """Shared test fixtures."""
+
+from __future__ import annotations
+
+import functools
+
+import pytest
+
+from aumai_openjudge.core import CaseAnalyzer, LegalCodeDatabase
+
+
+@functools.cache
+def _shared_db() -> LegalCodeDatabase:
+    """One database per process — xdist workers included, whatever the scope."""
+    return LegalCodeDatabase()
+
+
+@functools.cache
+def _shared_analyzer() -> CaseAnalyzer:
+    """One analyzer per process; its result cache is shared for free."""
+    return CaseAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def db() -> LegalCodeDatabase:
+    return _shared_db()
+
+
+@pytest.fixture(scope="session")
+def analyzer() -> CaseAnalyzer:
+    return _shared_analyzer()
@@ -7,8 +7,14 @@ Consult a qualified legal professional for any legal matters.
 
 from __future__ import annotations
 
+import functools
+import json
+import re
+import sys
+
 import pytest
-from hypothesis import given, settings
+from conftest import _shared_analyzer, _shared_db
+from hypothesis import Phase, given, settings
 from hypothesis import strategies as st
 from pydantic import ValidationError
 
@@ -24,7 +30,8 @@ from aumai_openjudge.models import (
 # Legal disclaimer
 # ---------------------------------------------------------------------------
 
-DISCLAIMER_TEXT = (
+# Interned so the comparison against LEGAL_DISCLAIMER is pointer equality.
+DISCLAIMER_TEXT = sys.intern(
     "This tool does NOT provide legal advice."
     " Case analysis is based on keyword matching and may be incomplete or inaccurate."
     " Always consult a qualified legal professional."
@@ -35,14 +42,30 @@ DISCLAIMER_TEXT = (
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def db() -> LegalCodeDatabase:
-    return LegalCodeDatabase()
+# The db and analyzer fixtures live in conftest.py, backed by per-process
+# cached factories; the Hypothesis tests below use the same shared analyzer
+# because fixtures cannot be injected into @given functions.
+_ANALYZER = _shared_analyzer()
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_analyze(description: str) -> CaseAnalysis:
+    """Analyse through the shared analyzer, memoising repeated descriptions.
+
+    The tests treat CaseAnalysis as immutable, so sharing one instance per
+    distinct description across the suite is safe.
+    """
+    return _ANALYZER.analyze(description)
 
 
-@pytest.fixture()
-def analyzer() -> CaseAnalyzer:
-    return CaseAnalyzer()
+@functools.lru_cache(maxsize=None)
+def _lookup_ipc_cached(section: str) -> LegalSection | None:
+    """Look up an IPC section once per distinct number across the suite.
+
+    Only for canonical-form queries; tests that exercise normalisation
+    (whitespace, lowercase suffixes) call the database directly.
+    """
+    return _shared_db().lookup_ipc(section)
 
 
 # ---------------------------------------------------------------------------
@@ -63,28 +86,96 @@ def test_legal_disclaimer_is_not_empty() -> None:
 # ---------------------------------------------------------------------------
 
 
-class TestLegalSection:
-    def test_valid_ipc_section(self) -> None:
-        section = LegalSection(
-            code="IPC",
-            section_number="302",
-            title="Murder",
-            description="Punishment for murder.",
-            punishment="Death or life imprisonment",
-            bailable=False,
-        )
-        assert section.code == "IPC"
-        assert section.section_number == "302"
-        assert section.bailable is False
+# Happy-path constructor cases: (label, constructor kwargs, expected attrs).
+VALID_SECTION_CASES: list[tuple[str, dict[str, object], dict[str, object]]] = [
+    (
+        "valid_ipc_section",
+        {
+            "code": "IPC",
+            "section_number": "302",
+            "title": "Murder",
+            "description": "Punishment for murder.",
+            "punishment": "Death or life imprisonment",
+            "bailable": False,
+        },
+        {"code": "IPC", "section_number": "302", "bailable": False},
+    ),
+    (
+        "valid_bns_section",
+        {
+            "code": "BNS",
+            "section_number": "103",
+            "title": "Murder",
+            "description": "Murder under BNS 2023.",
+        },
+        {"code": "BNS"},
+    ),
+    (
+        "punishment_optional",
+        {
+            "code": "IPC",
+            "section_number": "34",
+            "title": "Common intention",
+            "description": "Acts by several persons.",
+        },
+        {"punishment": None},
+    ),
+    (
+        "bailable_optional",
+        {
+            "code": "IPC",
+            "section_number": "34",
+            "title": "Common intention",
+            "description": "Acts by several persons.",
+        },
+        {"bailable": None},
+    ),
+    (
+        "bailable_true",
+        {
+            "code": "IPC",
+            "section_number": "379",
+            "title": "Theft",
+            "description": "Theft provisions.",
+            "bailable": True,
+        },
+        {"bailable": True},
+    ),
+    (
+        "crpc_code_valid",
+        {
+            "code": "CrPC",
+            "section_number": "156",
+            "title": "Police power",
+            "description": "Police officer's power to investigate cognizable case.",
+        },
+        {"code": "CrPC"},
+    ),
+    (
+        "pocso_code_valid",
+        {
+            "code": "POCSO",
+            "section_number": "4",
+            "title": "Penetrative sexual assault",
+            "description": "Punishment for penetrative sexual assault.",
+        },
+        {"code": "POCSO"},
+    ),
+]
 
-    def test_valid_bns_section(self) -> None:
-        section = LegalSection(
-            code="BNS",
-            section_number="103",
-            title="Murder",
-            description="Murder under BNS 2023.",
-        )
-        assert section.code == "BNS"
+
+class TestLegalSection:
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [(kwargs, expected) for _, kwargs, expected in VALID_SECTION_CASES],
+        ids=[label for label, _, _ in VALID_SECTION_CASES],
+    )
+    def test_legal_section_happy_path(
+        self, kwargs: dict[str, object], expected: dict[str, object]
+    ) -> None:
+        section = LegalSection(**kwargs)  # type: ignore[arg-type]
+        for attr, value in expected.items():
+            assert getattr(section, attr) == value
 
     def test_invalid_code_rejected(self) -> None:
         with pytest.raises(ValidationError):
@@ -95,52 +186,6 @@ class TestLegalSection:
                 description="Test",
             )
 
-    def test_punishment_optional(self) -> None:
-        section = LegalSection(
-            code="IPC",
-            section_number="34",
-            title="Common intention",
-            description="Acts by several persons.",
-        )
-        assert section.punishment is None
-
-    def test_bailable_optional(self) -> None:
-        section = LegalSection(
-            code="IPC",
-            section_number="34",
-            title="Common intention",
-            description="Acts by several persons.",
-        )
-        assert section.bailable is None
-
-    def test_bailable_true(self) -> None:
-        section = LegalSection(
-            code="IPC",
-            section_number="379",
-            title="Theft",
-            description="Theft provisions.",
-            bailable=True,
-        )
-        assert section.bailable is True
-
-    def test_crpc_code_valid(self) -> None:
-        section = LegalSection(
-            code="CrPC",
-            section_number="156",
-            title="Police power",
-            description="Police officer's power to investigate cognizable case.",
-        )
-        assert section.code == "CrPC"
-
-    def test_pocso_code_valid(self) -> None:
-        section = LegalSection(
-            code="POCSO",
-            section_number="4",
-            title="Penetrative sexual assault",
-            description="Punishment for penetrative sexual assault.",
-        )
-        assert section.code == "POCSO"
-
 
 # ---------------------------------------------------------------------------
 # LegalMapping model tests
@@ -225,23 +270,46 @@ class TestCaseAnalysis:
 # LegalCodeDatabase tests
 # ---------------------------------------------------------------------------
 
+# Precompiled case-insensitive checks, shared across lookup assertions.
+_CRUELTY_RE = re.compile(r"cruelty", re.IGNORECASE)
+_LIFE_OR_DEATH_RE = re.compile(r"life|death", re.IGNORECASE)
+
+# Well-known IPC -> BNS section renumberings under the 2023 transition.
+KNOWN_IPC_BNS_PAIRS: tuple[tuple[str, str], ...] = (
+    ("302", "103"),
+    ("376", "64"),
+    ("379", "303"),
+    ("420", "318"),
+    ("498A", "85"),
+)
+
 
 class TestLegalCodeDatabase:
-    def test_lookup_ipc_302(self, db: LegalCodeDatabase) -> None:
-        section = db.lookup_ipc("302")
+    def test_lookup_ipc_302(self) -> None:
+        section = _lookup_ipc_cached("302")
         assert section is not None
         assert section.title == "Murder"
         assert section.bailable is False
 
-    def test_lookup_ipc_379_theft_bailable(self, db: LegalCodeDatabase) -> None:
-        section = db.lookup_ipc("379")
+    def test_lookup_ipc_379_theft_bailable(self) -> None:
+        section = _lookup_ipc_cached("379")
         assert section is not None
         assert section.bailable is True
 
-    def test_lookup_ipc_498A(self, db: LegalCodeDatabase) -> None:
-        section = db.lookup_ipc("498A")
+    def test_lookup_ipc_498A(self) -> None:
+        section = _lookup_ipc_cached("498A")
         assert section is not None
-        assert "cruelty" in section.title.lower()
+        assert _CRUELTY_RE.search(section.title)
+
+    def test_lookup_ipc_lowercase_suffix(self, db: LegalCodeDatabase) -> None:
+        section = db.lookup_ipc("498a")
+        assert section is not None
+        assert section.section_number == "498A"
+
+    def test_map_ipc_to_bns_lowercase_suffix(self, db: LegalCodeDatabase) -> None:
+        mapping = db.map_ipc_to_bns("304b")
+        assert mapping is not None
+        assert mapping.new_section == "80"
 
     def test_lookup_ipc_nonexistent_returns_none(self, db: LegalCodeDatabase) -> None:
         assert db.lookup_ipc("9999") is None
@@ -280,40 +348,55 @@ class TestLegalCodeDatabase:
         mapping = db.map_ipc_to_bns("  302  ")
         assert mapping is not None
 
-    def test_all_ipc_returns_list(self, db: LegalCodeDatabase) -> None:
+    def test_all_ipc_returns_shared_tuple(self, db: LegalCodeDatabase) -> None:
         sections = db.all_ipc()
-        assert isinstance(sections, list)
+        assert isinstance(sections, tuple)
         assert len(sections) >= 20
+        assert db.all_ipc() is sections
 
-    def test_all_bns_returns_list(self, db: LegalCodeDatabase) -> None:
+    def test_all_bns_returns_shared_tuple(self, db: LegalCodeDatabase) -> None:
         sections = db.all_bns()
-        assert isinstance(sections, list)
+        assert isinstance(sections, tuple)
         assert len(sections) >= 20
+        assert db.all_bns() is sections
 
     def test_all_ipc_sections_have_code_ipc(self, db: LegalCodeDatabase) -> None:
-        for section in db.all_ipc():
-            assert section.code == "IPC"
+        bad = [s for s in db.all_ipc() if s.code != "IPC"]
+        assert not bad, bad[:3]
 
     def test_all_bns_sections_have_code_bns(self, db: LegalCodeDatabase) -> None:
-        for section in db.all_bns():
-            assert section.code == "BNS"
+        bad = [s for s in db.all_bns() if s.code != "BNS"]
+        assert not bad, bad[:3]
 
-    def test_ipc_murder_punishment(self, db: LegalCodeDatabase) -> None:
-        section = db.lookup_ipc("302")
+    def test_ipc_murder_punishment(self) -> None:
+        section = _lookup_ipc_cached("302")
         assert section is not None
         assert section.punishment is not None
-        assert "life" in section.punishment.lower() or "death" in section.punishment.lower()
+        assert _LIFE_OR_DEATH_RE.search(section.punishment)
+
+    def test_lookup_ipc_many(self, db: LegalCodeDatabase) -> None:
+        results = db.lookup_ipc_many(["302", "379", "9999"])
+        assert results["302"] is not None
+        assert results["302"].title == "Murder"
+        assert results["379"] is not None
+        assert results["9999"] is None
+
+    def test_lookup_bns_many(self, db: LegalCodeDatabase) -> None:
+        results = db.lookup_bns_many(["103", "9999"])
+        assert results["103"] is not None
+        assert results["9999"] is None
+
+    def test_map_ipc_to_bns_many(self, db: LegalCodeDatabase) -> None:
+        results = db.map_ipc_to_bns_many(["302", "420", "9999"])
+        assert results["302"] is not None
+        assert results["302"].new_section == "103"
+        assert results["420"] is not None
+        assert results["9999"] is None
 
     def test_known_ipc_to_bns_mappings(self, db: LegalCodeDatabase) -> None:
-        known_pairs = [
-            ("302", "103"),
-            ("376", "64"),
-            ("379", "303"),
-            ("420", "318"),
-            ("498A", "85"),
-        ]
-        for ipc_sec, expected_bns in known_pairs:
-            mapping = db.map_ipc_to_bns(ipc_sec)
+        mappings = db.map_ipc_to_bns_many(ipc for ipc, _ in KNOWN_IPC_BNS_PAIRS)
+        for ipc_sec, expected_bns in KNOWN_IPC_BNS_PAIRS:
+            mapping = mappings[ipc_sec]
             assert mapping is not None, f"No mapping found for IPC {ipc_sec}"
             assert mapping.new_section == expected_bns
 
@@ -323,124 +406,158 @@ class TestLegalCodeDatabase:
 # ---------------------------------------------------------------------------
 
 
+# One row per crime scenario: (label, description, acceptable IPC/BNS numbers).
+# The analyzer must surface at least one section from the expected set.
+CRIME_CASES: list[tuple[str, str, set[str]]] = [
+    ("murder", "The accused killed the victim with a knife.", {"302", "103"}),
+    ("theft", "The accused was caught stealing a mobile phone.", {"379", "303"}),
+    (
+        "domestic_violence",
+        "The husband subjected the wife to domestic violence and cruelty by husband.",
+        {"498A", "85"},
+    ),
+    ("rape", "The accused committed rape against the victim.", {"376", "64"}),
+    (
+        "kidnapping",
+        "The accused committed kidnapping of the child from the school.",
+        {"363", "137"},
+    ),
+    (
+        "cheating_fraud",
+        "The accused cheated the victim by running a scam and fraud scheme.",
+        {"420", "318"},
+    ),
+    (
+        "rioting",
+        "A mob attacked the police in rioting and mob violence near the town.",
+        {"147", "191"},
+    ),
+    (
+        "threat",
+        "The accused sent threatening messages and intimidation to the victim.",
+        {"506", "351"},
+    ),
+    (
+        "hit_and_run",
+        "The driver caused a hit and run accident death.",
+        {"304A", "106"},
+    ),
+    (
+        "dowry_death",
+        "The woman died due to dowry death within 2 years of marriage.",
+        {"304B", "80"},
+    ),
+]
+
+
 class TestCaseAnalyzer:
-    def test_analyze_returns_case_analysis(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused committed theft.")
+    def test_analyze_returns_case_analysis(self) -> None:
+        result = _cached_analyze("The accused committed theft.")
         assert isinstance(result, CaseAnalysis)
 
-    def test_analyze_disclaimer_always_present(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("Some case description.")
+    def test_analyze_disclaimer_always_present(self) -> None:
+        result = _cached_analyze("Some case description.")
         assert result.disclaimer == LEGAL_DISCLAIMER
 
-    def test_analyze_murder_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused killed the victim with a knife.")
-        assert len(result.relevant_sections) > 0
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "302" in section_numbers or "103" in section_numbers
-
-    def test_analyze_theft_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused was caught stealing a mobile phone.")
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "379" in section_numbers or "303" in section_numbers
-
-    def test_analyze_domestic_violence_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
-            "The husband subjected the wife to domestic violence and cruelty by husband."
-        )
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "498A" in section_numbers or "85" in section_numbers
-
-    def test_analyze_rape_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused committed rape against the victim.")
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "376" in section_numbers or "64" in section_numbers
-
-    def test_analyze_kidnapping_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused committed kidnapping of the child from the school.")
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "363" in section_numbers or "137" in section_numbers
-
-    def test_analyze_cheating_fraud_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
-            "The accused cheated the victim by running a scam and fraud scheme."
+    @pytest.mark.parametrize(
+        ("description", "expected_sections"),
+        [(desc, expected) for _, desc, expected in CRIME_CASES],
+        ids=[label for label, _, _ in CRIME_CASES],
+    )
+    def test_analyze_crime_case(
+        self,
+        description: str,
+        expected_sections: set[str],
+    ) -> None:
+        result = _cached_analyze(description)
+        section_numbers = {s.section_number for s in result.relevant_sections}
+        assert section_numbers & expected_sections
+
+    @pytest.mark.fast
+    def test_analyze_crime_matrix(self, analyzer: CaseAnalyzer) -> None:
+        """Smoke-check every crime scenario in one batched call.
+
+        Complements the parametrized per-case test: a single function for
+        CI smoke runs, with the failing description carried in the assert.
+        """
+        results = analyzer.analyze_batch([desc for _, desc, _ in CRIME_CASES])
+        for (_, desc, expected_sections), result in zip(
+            CRIME_CASES, results, strict=True
+        ):
+            section_numbers = {s.section_number for s in result.relevant_sections}
+            assert section_numbers & expected_sections, desc
+
+    def test_analyze_unknown_case(self) -> None:
+        result = _cached_analyze(
+            "This is a very unusual contract dispute between parties."
         )
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "420" in section_numbers or "318" in section_numbers
-
-    def test_analyze_unknown_case_returns_guidance(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("This is a very unusual contract dispute.")
-        # Should still return a CaseAnalysis with a meaningful summary
+        # No strong criminal keyword match → still a CaseAnalysis whose
+        # summary guides the reader to an advocate.
         assert isinstance(result, CaseAnalysis)
         assert len(result.summary) > 20
-
-    def test_analyze_unknown_case_empty_sections(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("This is a very unusual contract dispute between parties.")
-        # No strong criminal keyword match → empty sections or summary guides to advocate
         assert isinstance(result.relevant_sections, list)
 
-    def test_analyze_ipc_to_bns_mapping_included(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused committed theft and robbery.")
+    def test_analyze_ipc_to_bns_mapping_included(self) -> None:
+        result = _cached_analyze("The accused committed theft and robbery.")
         # IPC→BNS mappings should be populated
         assert isinstance(result.ipc_to_bns_mapping, list)
         assert len(result.ipc_to_bns_mapping) > 0
 
-    def test_analyze_summary_mentions_bns_transition(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The accused was involved in murder of the victim.")
+    def test_analyze_summary_mentions_bns_transition(self) -> None:
+        result = _cached_analyze("The accused was involved in murder of the victim.")
         # Summary should mention BNS replacing IPC
         assert "BNS" in result.summary or "Bharatiya" in result.summary
 
-    def test_analyze_case_description_preserved(self, analyzer: CaseAnalyzer) -> None:
+    def test_analyze_case_description_preserved(self) -> None:
         desc = "The accused committed theft in the dwelling house."
-        result = analyzer.analyze(desc)
+        result = _cached_analyze(desc)
         assert result.case_description == desc
 
-    def test_analyze_rioting_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
-            "A mob attacked the police in rioting and mob violence near the town."
-        )
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "147" in section_numbers or "191" in section_numbers
-
-    def test_analyze_threat_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
-            "The accused sent threatening messages and intimidation to the victim."
-        )
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "506" in section_numbers or "351" in section_numbers
-
-    def test_analyze_multiple_crimes_in_one_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
+    def test_analyze_multiple_crimes_in_one_case(self) -> None:
+        result = _cached_analyze(
             "The accused committed theft and assault resulting in grievous hurt."
         )
         assert len(result.relevant_sections) > 2
 
-    def test_analyze_case_insensitive(self, analyzer: CaseAnalyzer) -> None:
-        result_lower = analyzer.analyze("theft occurred at the shop.")
-        result_upper = analyzer.analyze("THEFT OCCURRED AT THE SHOP.")
+    def test_analyze_case_insensitive(self) -> None:
+        result_lower = _cached_analyze("theft occurred at the shop.")
+        result_upper = _cached_analyze("THEFT OCCURRED AT THE SHOP.")
         # Both should find theft sections
         assert len(result_lower.relevant_sections) > 0
         assert len(result_upper.relevant_sections) > 0
 
-    def test_analyze_no_duplicate_sections(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
+    def test_analyze_no_duplicate_sections(self) -> None:
+        result = _cached_analyze(
             "The accused committed murder, theft, robbery and dacoity."
         )
-        section_ids = [
+        section_ids = {
             f"{s.code}-{s.section_number}" for s in result.relevant_sections
-        ]
-        assert len(section_ids) == len(set(section_ids))
-
-    def test_analyze_hit_and_run_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze("The driver caused a hit and run accident death.")
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "304A" in section_numbers or "106" in section_numbers
+        }
+        assert len(section_ids) == len(result.relevant_sections)
 
-    def test_analyze_dowry_death_case(self, analyzer: CaseAnalyzer) -> None:
-        result = analyzer.analyze(
-            "The woman died due to dowry death within 2 years of marriage."
-        )
-        section_numbers = [s.section_number for s in result.relevant_sections]
-        assert "304B" in section_numbers or "80" in section_numbers
+    def test_analyze_batch_preserves_order(self, analyzer: CaseAnalyzer) -> None:
+        descriptions = [
+            "The accused committed theft.",
+            "The accused committed murder.",
+            "The accused committed theft.",
+        ]
+        results = analyzer.analyze_batch(descriptions)
+        assert len(results) == 3
+        assert [r.case_description for r in results] == descriptions
+        # Identical descriptions share one analysis
+        assert results[0] is results[2]
+
+    def test_analyze_batch_empty(self, analyzer: CaseAnalyzer) -> None:
+        assert analyzer.analyze_batch([]) == []
+
+    def test_analyze_batch_json_round_trips(self, analyzer: CaseAnalyzer) -> None:
+        descriptions = [
+            "The accused committed theft.",
+            "The accused committed murder.",
+        ]
+        payload = json.loads(analyzer.analyze_batch_json(descriptions))
+        assert [item["case_description"] for item in payload] == descriptions
+        assert all(item["disclaimer"] == LEGAL_DISCLAIMER for item in payload)
 
 
 # ---------------------------------------------------------------------------
@@ -449,18 +566,22 @@ class TestCaseAnalyzer:
 
 
 class TestDisclaimerIntegration:
-    def test_disclaimer_in_all_analyses(self, analyzer: CaseAnalyzer) -> None:
-        cases = [
+    @pytest.mark.parametrize(
+        "case",
+        [
             "The accused committed murder.",
             "Theft occurred at the shop.",
             "Domestic cruelty by husband.",
             "An unrelated contractual matter.",
-        ]
-        for case in cases:
-            result = analyzer.analyze(case)
-            assert result.disclaimer == LEGAL_DISCLAIMER, (
-                f"Disclaimer missing in analysis for: {case}"
-            )
+        ],
+        ids=["murder", "theft", "cruelty", "no-match"],
+    )
+    def test_disclaimer_in_all_analyses(self, case: str) -> None:
+        result = _cached_analyze(case)
+        # pydantic passes the str through unchanged, so identity holds.
+        assert result.disclaimer is LEGAL_DISCLAIMER, (
+            f"Disclaimer missing in analysis for: {case}"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -469,19 +590,48 @@ class TestDisclaimerIntegration:
 
 
 @given(description=st.text(min_size=5, max_size=200))
-@settings(max_examples=20)
+@settings(
+    max_examples=10,
+    deadline=None,
+    database=None,
+    derandomize=True,
+    phases=[Phase.generate],
+)
 def test_analyze_never_raises(description: str) -> None:
     """CaseAnalyzer.analyze must never raise an exception for arbitrary strings."""
-    analyzer = CaseAnalyzer()
-    result = analyzer.analyze(description)
+    result = _ANALYZER.analyze(description)
+    assert isinstance(result, CaseAnalysis)
+    assert result.disclaimer == LEGAL_DISCLAIMER
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "",
+        "a" * 500,
+        "non-ascii: 日本語",
+        "murder" * 100,
+        "\x00bad",
+        "\ud800 lone surrogate",
+    ],
+    ids=[
+        "empty",
+        "long-run",
+        "non-ascii",
+        "repeated-keyword",
+        "nul-byte",
+        "lone-surrogate",
+    ],
+)
+def test_analyze_adversarial_corpus(description: str) -> None:
+    """Fixed regressions for inputs Hypothesis found or might find."""
+    result = _ANALYZER.analyze(description)
     assert isinstance(result, CaseAnalysis)
     assert result.disclaimer == LEGAL_DISCLAIMER
 
 
-@given(section=st.sampled_from(["302", "376", "379", "420", "498A", "304B", "363"]))
-@settings(max_examples=10)
+@pytest.mark.parametrize("section", ["302", "376", "379", "420", "498A", "304B", "363"])
 def test_known_ipc_sections_always_found(section: str) -> None:
-    db = LegalCodeDatabase()
-    result = db.lookup_ipc(section)
+    result = _lookup_ipc_cached(section)
     assert result is not None
     assert result.section_number == section